@@ -5,6 +5,7 @@ from puslib.pus_policy import PusPolicy
 __version__ = "0.2.5"
 
 _pus_policy = PusPolicy()
+_pus_policy_version = 0  # incremented on each policy change, lets users cache policy lookups
 
 
 def set_policy(policy):
@@ -20,8 +21,9 @@ def set_policy(policy):
     Arguments:
         policy -- PUS policy
     """
-    global _pus_policy  # pylint: disable=global-statement
+    global _pus_policy, _pus_policy_version  # pylint: disable=global-statement
     _pus_policy = policy
+    _pus_policy_version += 1
 
 
 def get_policy():
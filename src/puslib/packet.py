@@ -10,7 +10,9 @@ Implementations of the following packet formats:
 import struct
 from enum import IntEnum, IntFlag
 from dataclasses import dataclass
-from typing import Optional, SupportsBytes
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, Optional, SupportsBytes
 
 from puslib.exceptions import CrcException, IncompletePacketException, InvalidPacketException
 from puslib.time import CucTime
@@ -23,7 +25,9 @@ TM_PACKET_PUS_VERSION_NUMBER = 1
 TC_PACKET_PUS_VERSION_NUMBER = 1
 
 _COMMON_SEC_HDR_STRUCT = struct.Struct('>BBB')
-_PEC_FIELD_SIZE = 2
+_REQUEST_ID_STRUCT = struct.Struct('>HH')
+_PEC_STRUCT = struct.Struct('>H')
+_PEC_FIELD_SIZE = _PEC_STRUCT.size
 
 
 def _validate_int_field(field_name: str, val: int, min_val: int, max_val: int):
@@ -52,6 +56,23 @@ class SequenceFlag(IntEnum):
     UNSEGMENTED = 0b11
 
 
+def _write_into(buffer: bytearray | memoryview, offset: int, binary: bytes) -> int:
+    size = len(binary)
+    if offset < 0:
+        raise ValueError("Buffer offset must not be negative")  # a negative slice start would grow a bytearray
+    if len(buffer) - offset < size:
+        raise ValueError("Buffer too small to hold packet")
+    buffer[offset:offset + size] = binary
+    return size
+
+
+@lru_cache(maxsize=256)
+def _packet_id(packet_version_number: int, packet_type: PacketType, secondary_header_flag: bool, apid: int) -> int:
+    # Memoized as the packet ID is the same for all packets of an APID and packet type.
+    # The sequence control word changes with every packet, thus not worth caching.
+    return packet_version_number << 13 | (1 if packet_type == PacketType.TC else 0) << 12 | (1 if secondary_header_flag else 0) << 11 | apid
+
+
 @dataclass(slots=True)
 class _PacketPrimaryHeader:
     packet_version_number: int = _CCSDS_PACKET_VERSION_NUMBER
@@ -70,6 +91,7 @@ class _PacketPrimaryHeader:
 
 class CcsdsSpacePacket:
     """Represent a CCSDS space packet."""
+    __slots__ = ('header', 'secondary_header', 'payload', '_has_pec')
 
     _IDLE_APID = 0b11111111111
     _CCSDS_HDR_STRUCT = struct.Struct('>HHH')
@@ -109,13 +131,19 @@ class CcsdsSpacePacket:
     def has_pec(self) -> bool:
         return self._has_pec
 
-    def serialize(self) -> SupportsBytes:
+    def serialize(self, buffer: bytearray | memoryview | None = None, offset: int = 0) -> SupportsBytes | int:
         """Serialize the packet to its binary format.
 
+        Keyword Arguments:
+            buffer -- writable buffer to serialize the packet into instead of returning a new byte array (default: {None})
+            offset -- position in buffer to write the packet at (default: {0})
+
         Returns:
-            byte array
+            byte array, or number of bytes written if a buffer is given
         """
-        packet_id = self.header.packet_version_number << 13 | (1 if self.header.packet_type == PacketType.TC else 0) << 12 | (1 if self.header.secondary_header_flag else 0) << 11 | self.header.apid
+        if buffer is not None:
+            return _write_into(buffer, offset, self.serialize())
+        packet_id = _packet_id(self.header.packet_version_number, self.header.packet_type, self.header.secondary_header_flag, self.header.apid)
         seq_ctrl = self.header.seq_flags << 14 | self.header.seq_count_or_name
         ccsds_header = self._CCSDS_HDR_STRUCT.pack(packet_id, seq_ctrl, self.header.data_length)
         if self.header.secondary_header_flag:
@@ -124,10 +152,29 @@ class CcsdsSpacePacket:
             packet_data_field = self.payload
         return ccsds_header + packet_data_field
 
+    @staticmethod
+    def serialize_many(packets: Iterable["CcsdsSpacePacket"], buffer: bytearray | memoryview, offset: int = 0) -> list[int]:
+        """Serialize a sequence of packets back to back into a buffer.
+
+        Arguments:
+            packets -- packets to serialize
+            buffer -- writable buffer to serialize the packets into
+
+        Keyword Arguments:
+            offset -- position in buffer to write the first packet at (default: {0})
+
+        Returns:
+            position in buffer of each packet
+        """
+        binaries = [packet.serialize() for packet in packets]
+        offsets = list(accumulate(map(len, binaries), initial=offset))
+        _write_into(buffer, offset, b''.join(binaries))  # one copy into the buffer instead of one per packet
+        return offsets[:-1]
+
     def request_id(self) -> SupportsBytes:
-        packet_id = self.header.packet_version_number << 13 | (1 if self.header.packet_type == PacketType.TC else 0) << 12 | (1 if self.header.secondary_header_flag else 0) << 11 | self.header.apid
+        packet_id = _packet_id(self.header.packet_version_number, self.header.packet_type, self.header.secondary_header_flag, self.header.apid)
         seq_ctrl = self.header.seq_flags << 14 | self.header.seq_count_or_name
-        return struct.pack('>HH', packet_id, seq_ctrl)
+        return _REQUEST_ID_STRUCT.pack(packet_id, seq_ctrl)
 
     @classmethod
     def deserialize(cls, buffer: SupportsBytes, has_pec: bool = True, validate_pec: bool = True) -> "CcsdsSpacePacket":
@@ -173,7 +220,7 @@ class CcsdsSpacePacket:
             apid -- application ID (default: {2047})
             seq_flags -- sequence flags (default: {SequenceFlag.UNSEGMENTED})
             seq_count_or_name -- sequence count (default: {0})
-            data -- user data field (default: {None})
+            data -- user data field, a memoryview is referenced and not copied, i.e., the viewed buffer must not be modified afterwards (default: {None})
 
         Returns:
             packet object
@@ -205,12 +252,16 @@ class CcsdsSpacePacket:
         packet.header.seq_count_or_name = seq_count
 
         data = kwargs.get('data', None)
-        if isinstance(data, (bytearray, bytes, type(None))):
+        if isinstance(data, (bytearray, bytes, memoryview, type(None))):
             if data is None:
                 data = bytes()
-            packet.payload = data
+            elif isinstance(data, memoryview):
+                if not data.c_contiguous:
+                    raise ValueError("Application data memoryview must be contiguous")
+                data = data.cast('B')  # flat and counted in octets, not items
+            packet.payload = data  # kept as is, e.g., a memoryview is not copied
         else:
-            raise TypeError("Application data must be None, bytes or a bytearray")
+            raise TypeError("Application data must be None, bytes, a bytearray or a memoryview")
 
         data_length = kwargs.get('data_length', None)
         data_size_except_source_data = kwargs.get('secondary_header_length', 0) + (2 if packet.has_pec else 0)
@@ -240,6 +291,9 @@ class AckFlag(IntFlag):
     COMPLETION = 0b1000
 
 
+_ACK_FLAGS = tuple(AckFlag(value) for value in range(16))  # indexed by the 4 bit field, avoids the enum lookup
+
+
 @dataclass(slots=True)
 class _PacketSecondaryHeaderTc:
     pus_version: int = TC_PACKET_PUS_VERSION_NUMBER
@@ -251,7 +305,10 @@ class _PacketSecondaryHeaderTc:
 
 class PusTcPacket(CcsdsSpacePacket):
     """Represent a PUS TC packet."""
-    _SOURCE_FIELD_SIZE = 1
+    __slots__ = ()
+
+    _SOURCE_FIELD_STRUCT = struct.Struct('>B')
+    _SOURCE_FIELD_SIZE = _SOURCE_FIELD_STRUCT.size
 
     def __init__(self, has_pec: bool = True):
         super().__init__(has_pec)
@@ -287,7 +344,8 @@ class PusTcPacket(CcsdsSpacePacket):
         Returns:
             true if ack is expected
         """
-        return ack_flag in self.secondary_header.ack_flags
+        ack_flag = int(ack_flag)  # plain int operations, IntFlag operators are comparatively slow
+        return int(self.secondary_header.ack_flags) & ack_flag == ack_flag
 
     @property
     def service(self) -> int:
@@ -305,18 +363,20 @@ class PusTcPacket(CcsdsSpacePacket):
     def app_data(self) -> SupportsBytes:
         return self.payload
 
-    def serialize(self):
+    def serialize(self, buffer: bytearray | memoryview | None = None, offset: int = 0) -> SupportsBytes | int:
+        if buffer is not None:
+            return _write_into(buffer, offset, self.serialize())
         ccsds_header = super().serialize()
 
         if self.header.secondary_header_flag:
             # First static part of secondary header
-            tmp = self.secondary_header.pus_version << 4 | self.secondary_header.ack_flags
+            tmp = self.secondary_header.pus_version << 4 | int(self.secondary_header.ack_flags)
             values = [tmp, self.secondary_header.service_type, self.secondary_header.service_subtype]
             ccsds_sec_header_static = _COMMON_SEC_HDR_STRUCT.pack(*values)
 
             # Last "optional" part of secondary header
             if self.secondary_header.source is not None:
-                ccsds_sec_header_source = self.secondary_header.source.to_bytes(self._SOURCE_FIELD_SIZE, byteorder='big')
+                ccsds_sec_header_source = self._SOURCE_FIELD_STRUCT.pack(self.secondary_header.source)
             else:
                 ccsds_sec_header_source = bytes()
         else:
@@ -327,8 +387,7 @@ class PusTcPacket(CcsdsSpacePacket):
         packet_without_pec = ccsds_header + (ccsds_sec_header_static + ccsds_sec_header_source if self.header.secondary_header_flag else bytes()) + (self.payload if self.header.secondary_header_flag else bytes())
         if self.has_pec:
             mem_view = memoryview(packet_without_pec)
-            pec = crc_ccitt_calculate(mem_view)
-            pec = pec.to_bytes(_PEC_FIELD_SIZE, byteorder='big')
+            pec = _PEC_STRUCT.pack(crc_ccitt_calculate(mem_view))
         else:
             pec = bytes()
 
@@ -361,12 +420,12 @@ class PusTcPacket(CcsdsSpacePacket):
             # First static part of secondary header
             tmp, service_type, service_subtype = _COMMON_SEC_HDR_STRUCT.unpack_from(buffer, offset)
             pus_version = (tmp >> 4) & 0b1111
-            ack_flags = AckFlag(tmp & 0b1111)
+            ack_flags = _ACK_FLAGS[tmp & 0b1111]
             offset += _COMMON_SEC_HDR_STRUCT.size
 
             # Last "optional" part of secondary header
             if has_source_field:
-                source = int.from_bytes(buffer[offset:offset + cls._SOURCE_FIELD_SIZE], byteorder='big')
+                source, = cls._SOURCE_FIELD_STRUCT.unpack_from(buffer, offset)
                 offset += cls._SOURCE_FIELD_SIZE
             else:
                 source = None
@@ -430,7 +489,7 @@ class PusTcPacket(CcsdsSpacePacket):
             service_type - service type (default: {None})
             service_subtype - message subtype (default: {None})
             source -- source ID (default: {None})
-            data -- user data field (default: {None})
+            data -- user data field, a memoryview is referenced and not copied, i.e., the viewed buffer must not be modified afterwards (default: {None})
 
         Returns:
             packet object
@@ -484,8 +543,12 @@ class _PacketSecondaryHeaderTm:
 
 
 class PusTmPacket(CcsdsSpacePacket):
-    _MSG_TYPE_COUNTER_FIELD_SIZE = 1
-    _DESTINATION_FIELD_SIZE = 1
+    __slots__ = ()
+
+    _MSG_TYPE_COUNTER_FIELD_STRUCT = struct.Struct('>B')
+    _MSG_TYPE_COUNTER_FIELD_SIZE = _MSG_TYPE_COUNTER_FIELD_STRUCT.size
+    _DESTINATION_FIELD_STRUCT = struct.Struct('>B')
+    _DESTINATION_FIELD_SIZE = _DESTINATION_FIELD_STRUCT.size
 
     def __init__(self, has_pec: bool = True):
         super().__init__(has_pec)
@@ -540,7 +603,9 @@ class PusTmPacket(CcsdsSpacePacket):
     def source_data(self) -> SupportsBytes:
         return self.payload
 
-    def serialize(self):
+    def serialize(self, buffer: bytearray | memoryview | None = None, offset: int = 0) -> SupportsBytes | int:
+        if buffer is not None:
+            return _write_into(buffer, offset, self.serialize())
         ccsds_header = super().serialize()
 
         # First static part of secondary header
@@ -550,11 +615,11 @@ class PusTmPacket(CcsdsSpacePacket):
 
         # "Optional" parts of secondary header
         if self.secondary_header.msg_type_counter is not None:
-            ccsds_sec_header_msg_type_counter = self.secondary_header.msg_type_counter.to_bytes(self._MSG_TYPE_COUNTER_FIELD_SIZE, byteorder='big')
+            ccsds_sec_header_msg_type_counter = self._MSG_TYPE_COUNTER_FIELD_STRUCT.pack(self.secondary_header.msg_type_counter)
         else:
             ccsds_sec_header_msg_type_counter = bytes()
         if self.secondary_header.destination is not None:
-            ccsds_sec_header_destination = self.secondary_header.destination.to_bytes(self._DESTINATION_FIELD_SIZE, byteorder='big')
+            ccsds_sec_header_destination = self._DESTINATION_FIELD_STRUCT.pack(self.secondary_header.destination)
         else:
             ccsds_sec_header_destination = bytes()
 
@@ -562,8 +627,7 @@ class PusTmPacket(CcsdsSpacePacket):
         packet_without_pec = ccsds_header + ccsds_sec_header_static + ccsds_sec_header_msg_type_counter + ccsds_sec_header_destination + bytes(self.secondary_header.time) + self.payload
         if self.has_pec:
             mem_view = memoryview(packet_without_pec)
-            pec = crc_ccitt_calculate(mem_view)
-            pec = pec.to_bytes(_PEC_FIELD_SIZE, byteorder='big')
+            pec = _PEC_STRUCT.pack(crc_ccitt_calculate(mem_view))
         else:
             pec = bytes()
 
@@ -604,21 +668,22 @@ class PusTmPacket(CcsdsSpacePacket):
 
             # "Optional" parts of secondary header
             if has_type_counter_field:
-                msg_type_counter = int.from_bytes(buffer[offset:offset + cls._MSG_TYPE_COUNTER_FIELD_SIZE], byteorder='big')
+                msg_type_counter, = cls._MSG_TYPE_COUNTER_FIELD_STRUCT.unpack_from(buffer, offset)
                 offset += cls._MSG_TYPE_COUNTER_FIELD_SIZE
             else:
                 msg_type_counter = None
             if has_destination_field:
-                destination = int.from_bytes(buffer[offset:offset + cls._DESTINATION_FIELD_SIZE], byteorder='big')
+                destination, = cls._DESTINATION_FIELD_STRUCT.unpack_from(buffer, offset)
                 offset += cls._DESTINATION_FIELD_SIZE
             else:
                 destination = None
 
+            time_field = memoryview(buffer)[offset:]  # not copying the remainder of the buffer
             if cuc_time:
-                cuc_time.from_bytes(buffer[offset:])
+                cuc_time.from_bytes(time_field)
             else:
                 try:
-                    cuc_time = CucTime.deserialize(buffer[offset:])
+                    cuc_time = CucTime.deserialize(time_field)
                 except ValueError as ex:
                     raise IncompletePacketException() from ex
                 data_field_except_source_length += len(cuc_time)
@@ -695,7 +760,7 @@ class PusTmPacket(CcsdsSpacePacket):
             msg_type_counter - message type counter (default: {None})
             destination -- destination ID (default: {None})
             time -- timestamp (default: {None})
-            data -- user data field (default: {None})
+            data -- user data field, a memoryview is referenced and not copied, i.e., the viewed buffer must not be modified afterwards (default: {None})
 
         Returns:
             packet object
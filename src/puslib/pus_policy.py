@@ -1,5 +1,5 @@
-from functools import partial
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Type
 from datetime import datetime
 
@@ -15,7 +15,7 @@ class Time:
     has_preamble: bool = False
     basic_unit_length: int = 4
     frac_unit_length: int = 3
-    epoch=datetime(year=1950, month=1, day=1)
+    epoch: datetime = datetime(year=1950, month=1, day=1)
 
 
 @dataclass(slots=True)
@@ -29,23 +29,28 @@ class Telemetry:
     """Telemetry related settings."""
     destination_id_type: Type[Parameter] | None = 2
     msg_type_counter_type: Type[Parameter] | None = 2
-    time = Time()
+    time: Time = field(default_factory=Time)
 
 
+_msg_type_counters = defaultdict(int)
 
 
- 
+def subcounter(**kwargs):
+    """Return next message type counter value of the service type and subtype in kwargs.
 
-def subcounter(counter={},/, **kwargs):
-    
-    try:
-        key = (kwargs["service_type"], kwargs["service_subtype"])
-    except KeyError:
+    Returns:
+        counter value [0..255], or None if service type or subtype is missing
+    """
+    service_type = kwargs.get("service_type")
+    service_subtype = kwargs.get("service_subtype")
+    if service_type is None or service_subtype is None:
         return None
-    count = counter.get(key, 0)
-    counter[key] = (count + 1) % 256
+    key = (service_type, service_subtype)
+    count = _msg_type_counters[key]
+    _msg_type_counters[key] = (count + 1) & 0xff
     return count
 
+
 class PusPolicy:
     """Represent a PUS policy.
 
@@ -54,7 +59,8 @@ class PusPolicy:
     undefined or mission-dependent. This policy collects a variety of such mission dependencies.
 
     The PUS policy consists of:
-    - partial functions for creating PUS related primitives, e.g., TM and TC packets.
+    - factory methods for creating PUS related primitives, e.g., TM and TC packets.
+      They read the policy attributes on each call, so attribute changes apply directly.
     - attributes defining types of various data fields.
 
     In order to create a mission-specific PUS policy, you can create your own policy
@@ -63,67 +69,69 @@ class PusPolicy:
     """
 
     def __init__(self):
-        self.common = self.Common
-        self.request_verification = self.RequestVerification
-        self.housekeeping = self.Housekeeping
-        self.event_reporting = self.EventReporting
-        self.function_management = self.FunctionManagement
-
+        self.common = self.Common()
+        self.request_verification = self.RequestVerification()
+        self.housekeeping = self.Housekeeping()
+        self.event_reporting = self.EventReporting()
+        self.function_management = self.FunctionManagement()
+
+    # The factories read the policy attributes on each call, so changes to a policy in use
+    # apply to the next created primitive. Caller keyword arguments take precedence.
     def CucTime(self, *args, **kwargs):  # pylint: disable=invalid-name
-        func = partial(
-            CucTime.create,
-            basic_unit_length=self.common.tm.time.basic_unit_length,
-            frac_unit_length=self.common.tm.time.frac_unit_length,
-            has_preamble=self.common.tm.time.has_preamble,
-            epoch=self.common.tm.time.epoch)
-            
-        return func(*args, **kwargs)
+        time_settings = self.common.tm.time
+        kwargs = {
+            'basic_unit_length': time_settings.basic_unit_length,
+            'frac_unit_length': time_settings.frac_unit_length,
+            'has_preamble': time_settings.has_preamble,
+            'epoch': time_settings.epoch,
+            **kwargs}
+        if args or 'seconds' in kwargs or 'fraction' in kwargs:
+            return CucTime.create(*args, **kwargs)
+        return CucTime.now(**kwargs)  # current time if no time given
 
     def PusTcPacket(self, *args, **kwargs):  # pylint: disable=invalid-name
-        func = partial(
-            PusTcPacket.create,
-            pus_version=self.common.pus_version,
-            ack_flags=AckFlag.NONE,
-            source=self.common.tc.source_id_type,
-            msg_type_counter=subcounter(**kwargs),)
-        return func(*args, **kwargs)
-    
-
-
+        common = self.common
+        kwargs = {
+            'pus_version': common.pus_version,
+            'ack_flags': AckFlag.NONE,
+            'source': common.tc.source_id_type,
+            **kwargs}
+        return PusTcPacket.create(*args, **kwargs)
 
     def PusTmPacket(self, *args, **kwargs):  # pylint: disable=invalid-name
-        func = partial(
-            PusTmPacket.create,
-            pus_version=self.common.pus_version,
-            msg_type_counter=subcounter(**kwargs),
-            destination=self.common.tm.destination_id_type)
-        return func(*args, **kwargs)
+        kwargs.setdefault('msg_type_counter', subcounter(**kwargs))
+        common = self.common
+        kwargs = {
+            'pus_version': common.pus_version,
+            'destination': common.tm.destination_id_type,
+            **kwargs}
+        return PusTmPacket.create(*args, **kwargs)
 
     @dataclass(slots=True)
     class Common:
         """Policies common for all PUS services."""
-        tc = Telecommanding()
-        tm = Telemetry()
-        pus_version = 1  # 1 - PUS rev A; 2 - PUS rev C
-        param_id_type = UInt32Parameter
+        tc: Telecommanding = field(default_factory=Telecommanding)
+        tm: Telemetry = field(default_factory=Telemetry)
+        pus_version: int = 1  # 1 - PUS rev A; 2 - PUS rev C
+        param_id_type: Type[Parameter] = UInt32Parameter
 
     @dataclass(slots=True)
     class RequestVerification:
-        failure_code_type = UInt8Parameter
+        failure_code_type: Type[Parameter] = UInt8Parameter
 
     @dataclass(slots=True)
     class Housekeeping:
-        structure_id_type = UInt32Parameter
-        collection_interval_type = UInt16Parameter
-        count_type = UInt16Parameter
-        periodic_generation_action_status_type = UInt8Parameter  # TM[3,35] & TM[3,36]
+        structure_id_type: Type[Parameter] = UInt32Parameter
+        collection_interval_type: Type[Parameter] = UInt16Parameter
+        count_type: Type[Parameter] = UInt16Parameter
+        periodic_generation_action_status_type: Type[Parameter] = UInt8Parameter  # TM[3,35] & TM[3,36]
 
     @dataclass(slots=True)
     class EventReporting:
-        event_definition_id_type = UInt32Parameter
-        count_type = UInt8Parameter
+        event_definition_id_type: Type[Parameter] = UInt32Parameter
+        count_type: Type[Parameter] = UInt8Parameter
 
     @dataclass(slots=True)
     class FunctionManagement:
-        function_id_type = UInt16Parameter
-        count_type = UInt8Parameter
+        function_id_type: Type[Parameter] = UInt16Parameter
+        count_type: Type[Parameter] = UInt8Parameter
@@ -1,4 +1,5 @@
 from enum import IntEnum
+from functools import lru_cache
 from typing import SupportsBytes
 
 from puslib import get_policy
@@ -21,6 +22,18 @@ class _SubService(IntEnum):
     FAILED_COMPLETION_OF_EXECUTION_VERIFICATION = 8
 
 
+# (failure, success) subservice pairs indexed by the success flag, as plain ints since reports are generated for every verified TC
+_ACCEPTANCE_SUBSERVICES = (_SubService.FAILED_ACCEPTANCE_VERIFICATION.value, _SubService.SUCCESSFUL_ACCEPTANCE_VERIFICATION.value)
+_START_SUBSERVICES = (_SubService.FAILED_START_OF_EXECUTION_VERIFICATION.value, _SubService.SUCCESSFUL_START_OF_EXECUTION_VERIFICATION.value)
+_PROGRESS_SUBSERVICES = (_SubService.FAILED_PROGRESS_OF_EXECUTION_VERIFICATION.value, _SubService.SUCCESSFUL_PROGRESS_OF_EXECUTION_VERIFICATION.value)
+_COMPLETION_SUBSERVICES = (_SubService.FAILED_COMPLETION_OF_EXECUTION_VERIFICATION.value, _SubService.SUCCESSFUL_COMPLETION_OF_EXECUTION_VERIFICATION.value)
+
+
+@lru_cache(maxsize=8)
+def _failure_code_length(failure_code_type) -> int:
+    return len(failure_code_type())
+
+
 class RequestVerification(PusService):
     """PUS service 1: Request verification service."""
 
@@ -52,12 +65,7 @@ class RequestVerification(PusService):
         """
         if not packet.ack(AckFlag.ACCEPTANCE):
             return
-        self._generate_report(
-            packet,
-            _SubService.SUCCESSFUL_ACCEPTANCE_VERIFICATION if success else _SubService.FAILED_ACCEPTANCE_VERIFICATION,
-            success,
-            failure_code,
-            failure_data)
+        self._generate_report(packet, _ACCEPTANCE_SUBSERVICES[success], success, failure_code, failure_data)
 
     def start(self, packet: PusTcPacket, success: bool = True, failure_code: CommonErrorCode | None = None, failure_data: SupportsBytes = None):
         """Generate start of execution verification report.
@@ -72,12 +80,7 @@ class RequestVerification(PusService):
         """
         if not packet.ack(AckFlag.START_OF_EXECUTION):
             return
-        self._generate_report(
-            packet,
-            _SubService.SUCCESSFUL_START_OF_EXECUTION_VERIFICATION if success else _SubService.FAILED_START_OF_EXECUTION_VERIFICATION,
-            success,
-            failure_code,
-            failure_data)
+        self._generate_report(packet, _START_SUBSERVICES[success], success, failure_code, failure_data)
 
     def progress(self, packet: PusTcPacket, success: bool = True, failure_code: CommonErrorCode | None = None, failure_data: SupportsBytes = None):
         """Generate progress of execution verification report.
@@ -92,12 +95,7 @@ class RequestVerification(PusService):
         """
         if not packet.ack(AckFlag.PROGRESS):
             return
-        self._generate_report(
-            packet,
-            _SubService.SUCCESSFUL_PROGRESS_OF_EXECUTION_VERIFICATION if success else _SubService.FAILED_PROGRESS_OF_EXECUTION_VERIFICATION,
-            success,
-            failure_code,
-            failure_data)
+        self._generate_report(packet, _PROGRESS_SUBSERVICES[success], success, failure_code, failure_data)
 
     def complete(self, packet: PusTcPacket, success: bool = True, failure_code: CommonErrorCode | None = None, failure_data: SupportsBytes = None):
         """Generate completion of execution verification report.
@@ -112,21 +110,20 @@ class RequestVerification(PusService):
         """
         if not packet.ack(AckFlag.COMPLETION):
             return
-        self._generate_report(
-            packet,
-            _SubService.SUCCESSFUL_COMPLETION_OF_EXECUTION_VERIFICATION if success else _SubService.FAILED_COMPLETION_OF_EXECUTION_VERIFICATION,
-            success,
-            failure_code,
-            failure_data)
-
-    def _generate_report(self, packet: PusTcPacket, subservice: _SubService, success: bool, failure_code: CommonErrorCode | None, failure_data: SupportsBytes | None):
+        self._generate_report(packet, _COMPLETION_SUBSERVICES[success], success, failure_code, failure_data)
+
+    def _generate_report(self, packet: PusTcPacket, subservice: int, success: bool, failure_code: CommonErrorCode | None, failure_data: SupportsBytes | None):
         payload = packet.request_id()
         if not success:
             if not failure_code:
                 failure_code = CommonErrorCode.ILLEGAL_APP_DATA
-            payload += failure_code.value.to_bytes(len(get_policy().request_verification.failure_code_type()), byteorder='big') + (failure_data if failure_data else b'')
-        time = get_policy().CucTime()
-        report = get_policy().PusTmPacket(
+            payload = bytearray(payload)
+            payload += failure_code.value.to_bytes(_failure_code_length(get_policy().request_verification.failure_code_type), byteorder='big')
+            if failure_data:
+                payload += failure_data
+        tm_packet_factory, cuc_time_factory = self._factories
+        time = cuc_time_factory()
+        report = tm_packet_factory(
             apid=self._ident.apid,
             seq_count=self._ident.seq_count(),
             service_type=self._service_type.value,
@@ -132,47 +132,50 @@ class Housekeeping(PusService):
     @staticmethod
     def create_parameter_report(apid: int, seq_count: int, report: Report, diagnostic: bool = False):
         app_data = bytes(report)
-        packet = get_policy().PusTmPacket(
+        policy = get_policy()
+        packet = policy.PusTmPacket(
             apid=apid,
             seq_count=seq_count,
             service_type=PusServiceType.HOUSEKEEPING.value,
             service_subtype=26 if diagnostic else 25,
-            time=get_policy().CucTime(),
+            time=policy.CucTime(),
             data=app_data
         )
         return packet
 
     @staticmethod
     def create_structure_report(apid: int, seq_count: int, report: Report, diagnostic: bool = False):
-        app_data = bytes(get_policy().housekeeping.structure_id_type(report.id)) + \
-            bytes(get_policy().housekeeping.collection_interval_type(report.collection_interval)) + \
-            bytes(get_policy().housekeeping.count_type(len(report)))
+        policy = get_policy()
+        app_data = bytes(policy.housekeeping.structure_id_type(report.id)) + \
+            bytes(policy.housekeeping.collection_interval_type(report.collection_interval)) + \
+            bytes(policy.housekeeping.count_type(len(report)))
         for pid, _ in report:
-            app_data += bytes(get_policy().common.param_id_type(pid))
+            app_data += bytes(policy.common.param_id_type(pid))
         #app_data += get_policy().housekeeping.count_type(0).to_bytes()
-        packet = get_policy().PusTmPacket(
+        packet = policy.PusTmPacket(
             apid=apid,
             seq_count=seq_count,
             service_type=PusServiceType.HOUSEKEEPING.value,
             service_subtype=12 if diagnostic else 10,
-            time=get_policy().CucTime(),
+            time=policy.CucTime(),
             data=app_data
         )
         return packet
 
     @staticmethod
     def create_periodic_generation_properties_report(apid: int, seq_count: int, reports_to_report: Sequence[Report], diagnostic: bool = False):
-        app_data = bytes(get_policy().housekeeping.count_type(len(reports_to_report)))
+        policy = get_policy()
+        app_data = bytes(policy.housekeeping.count_type(len(reports_to_report)))
         for report in reports_to_report:
-            app_data += bytes(get_policy().housekeeping.structure_id_type(report.id)) + \
-                bytes(get_policy().housekeeping.periodic_generation_action_status_type(1 if report.enabled else 0)) + \
-                bytes(get_policy().housekeeping.collection_interval_type(report.collection_interval))
-        packet = get_policy().PusTmPacket(
+            app_data += bytes(policy.housekeeping.structure_id_type(report.id)) + \
+                bytes(policy.housekeeping.periodic_generation_action_status_type(1 if report.enabled else 0)) + \
+                bytes(policy.housekeeping.collection_interval_type(report.collection_interval))
+        packet = policy.PusTmPacket(
             apid=apid,
             seq_count=seq_count,
             service_type=PusServiceType.HOUSEKEEPING.value,
             service_subtype=36 if diagnostic else 35,
-            time=get_policy().CucTime(),
+            time=policy.CucTime(),
             data=app_data
         )
         return packet
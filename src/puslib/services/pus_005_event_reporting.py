@@ -116,9 +116,10 @@ class EventReporting(PusService):
         if not report.enabled:
             return
 
-        time = get_policy().CucTime()
+        tm_packet_factory, cuc_time_factory = self._factories
+        time = cuc_time_factory()
         payload = bytes(report)
-        packet = get_policy().PusTmPacket(
+        packet = tm_packet_factory(
             apid=self._ident.apid,
             seq_count=self._ident.seq_count(),
             service_type=self._service_type.value,
@@ -162,12 +163,13 @@ class EventReporting(PusService):
     def _report_disabled_events(self, app_data: SupportsBytes):
         if len(app_data) != 0:
             return False
-        time = get_policy().CucTime()
+        tm_packet_factory, cuc_time_factory = self._factories
+        time = cuc_time_factory()
         disabled_ids = [report.id for eid, report in self._reports.items() if not report.enabled]
         num_ids = get_policy().event_reporting.count_type(len(disabled_ids))
         fmt = ">" + f"{num_ids.format}{num_ids.value}{get_policy().event_reporting.event_definition_id_type().format}".replace('>', '')
         payload = struct.pack(fmt, num_ids.value, *disabled_ids)
-        packet = get_policy().PusTmPacket(
+        packet = tm_packet_factory(
             apid=self._ident.apid,
             seq_count=self._ident.seq_count(),
             service_type=self._service_type.value,
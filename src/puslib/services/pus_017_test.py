@@ -1,6 +1,5 @@
 from typing import SupportsBytes
 
-from puslib import get_policy
 from puslib.ident import PusIdent
 from puslib.streams.stream import OutputStream
 from puslib.services import RequestVerification
@@ -30,8 +29,9 @@ class Test(PusService):
         Returns:
             subservice status
         """
-        time = get_policy().CucTime()
-        report = get_policy().PusTmPacket(
+        tm_packet_factory, cuc_time_factory = self._factories
+        time = cuc_time_factory()
+        report = tm_packet_factory(
             apid=self._ident.apid,
             seq_count=self._ident.seq_count(),
             service_type=self._service_type.value,
@@ -51,8 +51,9 @@ class ParameterManagement(PusService):
         fmt = '>' + fmt.replace('>', '')
         values = [self._params[param_id].value for param_id in ids]
         source_data = struct.pack(fmt, num_ids.value, *[arg for pair in zip(ids, values) for arg in pair])
-        time = get_policy().CucTime()
-        packet = get_policy().PusTmPacket(
+        tm_packet_factory, cuc_time_factory = self._factories
+        time = cuc_time_factory()
+        packet = tm_packet_factory(
             apid=self._ident.apid,
             seq_count=self._ident.seq_count(),
             service_type=self._service_type.value,
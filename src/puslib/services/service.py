@@ -1,6 +1,7 @@
 import queue
 from enum import Enum
 
+import puslib
 from puslib.ident import PusIdent
 from puslib.packet import PusTcPacket
 from puslib.streams.stream import OutputStream
@@ -47,6 +48,9 @@ class PusService:
         self._incoming_tc_queue = queue.SimpleQueue()
         self._tm_output_stream = tm_output_stream
         self._pus_service_1 = pus_service_1
+        self._policy_version = -1
+        self._tm_packet_factory = None
+        self._cuc_time_factory = None
 
     @property
     def service(self) -> int:
@@ -60,6 +64,19 @@ class PusService:
     def description(self) -> str:
         return self._service_type.description
 
+    @property
+    def _factories(self):
+        """Return the TM packet and CUC time factories of the current PUS policy.
+
+        The factories are looked up once per policy change rather than per report.
+        """
+        if self._policy_version != puslib._pus_policy_version:  # pylint: disable=protected-access
+            policy = puslib.get_policy()
+            self._tm_packet_factory = policy.PusTmPacket
+            self._cuc_time_factory = policy.CucTime
+            self._policy_version = puslib._pus_policy_version  # pylint: disable=protected-access
+        return self._tm_packet_factory, self._cuc_time_factory
+
     def enqueue(self, tc_packet: PusTcPacket):
         """Enqueue an incoming PUS TC packet.
 
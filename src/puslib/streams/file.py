@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from puslib import get_policy
+from puslib.packet import PusTmPacket
 from puslib.streams.stream import InputStream
 
 
@@ -20,7 +21,7 @@ class FileInput(InputStream):
         while offset < len(data):
             other_headers = data[offset:offset + self._other_headers_size]
             offset += self._other_headers_size
-            packet = get_policy().PusTmPacket().deserialize(data[offset:], cuc_time=get_policy().CucTime(), has_type_counter_field=self._has_type_counter_field, has_destination_field=self._has_destination_field, validate_fields=False, validate_pec=self._validate_pec)
+            packet = self._deserialize(data[offset:])
             offset += len(packet)
             yield other_headers, packet
 
@@ -28,5 +29,8 @@ class FileInput(InputStream):
         with open(self._input, 'rb') as f:
             content = f.read()
         data = memoryview(content)
-        _, packet = get_policy().PusTmPacket.deserialize(data[self._other_headers_size + offset:], validate_fields=False, validate_pec=False)
+        packet = self._deserialize(data[self._other_headers_size + offset:])
         return packet
+
+    def _deserialize(self, data):
+        return PusTmPacket.deserialize(data, cuc_time=get_policy().CucTime(), has_type_counter_field=self._has_type_counter_field, has_destination_field=self._has_destination_field, validate_fields=False, validate_pec=self._validate_pec)
@@ -1,13 +1,19 @@
 import math
+import struct
 from enum import IntEnum
-from datetime import datetime
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from time import time_ns
 from typing import SupportsBytes
 
-import bitstring
-
 from puslib.exceptions import InvalidTimeFormat
 
 TAI_EPOCH = datetime(year=1958, month=1, day=1)  # International Atomic Time (TAI) epoch
+_UNIX_EPOCH = datetime(year=1970, month=1, day=1)
+_NS_PER_SECOND = 1_000_000_000
+_STRUCT_UINT_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_PREAMBLE_STRUCT = struct.Struct('>B')
+_EXTENDED_PREAMBLE_STRUCT = struct.Struct('>BB')
 
 
 class TimeCodeIdentification(IntEnum):
@@ -16,6 +22,9 @@ class TimeCodeIdentification(IntEnum):
 
 
 class _TimeFormat:
+    # Instances are shared between CUC times of the same format (see _make_format), thus read-only by convention
+    __slots__ = ('basic_unit_length', 'frac_unit_length', 'epoch', 'time_code_id', 'preamble', 'time_field_size', 'basic_max', 'frac_scale', 'frac_max', 'epoch_ns', 'time_field_struct', 'cuc_struct')
+
     def __init__(self, basic_unit_length, frac_unit_length, epoch=None, preamble=None):
         if not 1 <= basic_unit_length <= 7:
             raise InvalidTimeFormat("Basic time unit must be 1 to 7 octets")
@@ -23,9 +32,22 @@ class _TimeFormat:
         if not 0 <= frac_unit_length <= 10:
             raise InvalidTimeFormat("Fractional time unit must be 0 to 10 octets")
         self.frac_unit_length = frac_unit_length
+        self.time_field_size = basic_unit_length + frac_unit_length
+        self.basic_max = (1 << (basic_unit_length * 8)) - 1
+        self.frac_scale = 1 << (frac_unit_length * 8)
+        self.frac_max = self.frac_scale - 1
         self.epoch = epoch if epoch else TAI_EPOCH
         self.time_code_id = TimeCodeIdentification.AGENCY_DEFINED if epoch else TimeCodeIdentification.TAI
+        unix_epoch = _UNIX_EPOCH.replace(tzinfo=timezone.utc) if self.epoch.tzinfo else _UNIX_EPOCH
+        self.epoch_ns = (self.epoch - unix_epoch) // timedelta(microseconds=1) * 1000  # epoch relative to Unix epoch
         self.preamble = preamble if preamble else self._pack_preamble()
+        if basic_unit_length in _STRUCT_UINT_CODES and frac_unit_length in _STRUCT_UINT_CODES:
+            time_field_format = _STRUCT_UINT_CODES[basic_unit_length] + _STRUCT_UINT_CODES[frac_unit_length]
+            self.time_field_struct = struct.Struct('>' + time_field_format)
+            self.cuc_struct = struct.Struct(f'>{len(self.preamble)}s' + time_field_format)  # preamble and time field
+        else:
+            self.time_field_struct = None  # field lengths not expressible as a struct format
+            self.cuc_struct = None
 
     def __bytes__(self):
         return self.preamble
@@ -41,11 +63,34 @@ class _TimeFormat:
         basic_frac_unit_additional_octet = max(0, self.frac_unit_length - 3)
 
         octet1 = p_field_extension << 7 | self.time_code_id << 4 | basic_time_unit_num_octets << 2 | basic_frac_unit_num_octets
-        preamble = bytes([octet1])
         if p_field_extension:
             octet2 = basic_time_unit_additional_octet << 5 | basic_frac_unit_additional_octet << 2
-            preamble += bytes([octet2])
-        return preamble
+            return _EXTENDED_PREAMBLE_STRUCT.pack(octet1, octet2)
+        return _PREAMBLE_STRUCT.pack(octet1)
+
+    def pack_time_field(self, seconds, fraction):
+        """Return binary coded time field of seconds and fraction."""
+        if self.time_field_struct:
+            return self.time_field_struct.pack(seconds, fraction)
+        # Other field lengths, e.g., 3 octet fractions, packed as one integer. Fraction is None if there are no fraction octets.
+        fraction = fraction or 0
+        if not (0 <= seconds <= self.basic_max and 0 <= fraction <= self.frac_max):
+            raise ValueError("Seconds or fraction out of range of the time field")  # would otherwise carry into the seconds
+        return (seconds * self.frac_scale + fraction).to_bytes(self.time_field_size, 'big')
+
+    def pack_time_field_into(self, buffer, offset, seconds, fraction):
+        """Write binary coded time field of seconds and fraction into a buffer and return its size."""
+        if self.time_field_struct:
+            self.time_field_struct.pack_into(buffer, offset, seconds, fraction)
+            return self.time_field_struct.size
+        buffer[offset:offset + self.time_field_size] = self.pack_time_field(seconds, fraction)
+        return self.time_field_size
+
+    def unpack_time_field(self, buffer, offset=0):
+        """Return seconds and fraction of a binary coded time field."""
+        if self.time_field_struct:
+            return self.time_field_struct.unpack_from(buffer, offset)
+        return divmod(int.from_bytes(buffer[offset:offset + self.time_field_size], 'big'), self.frac_scale)
 
     @classmethod
     def deserialize(cls, buffer):
@@ -58,9 +103,18 @@ class _TimeFormat:
             octet2 = buffer[1]
             basic_unit_length += (octet2 >> 5) & 0b11
         frac_unit_length = (octet1 & 0b11) + (((octet2 >> 2) & 0b111) if p_field_extension else 0)
-        epoch = (octet1 >> 4) & 0b111
-        preamble = bytes([buffer[0]]) + (bytes([buffer[1]]) if p_field_extension else b'')
-        return cls(basic_unit_length, frac_unit_length, epoch, preamble)
+        preamble = bytes(buffer[:2 if p_field_extension else 1])
+        return _make_format(basic_unit_length, frac_unit_length, None, preamble)  # epoch cannot be derived from the preamble
+
+
+@lru_cache(maxsize=16)
+def _make_format(basic_unit_length, frac_unit_length, epoch=None, preamble=None):
+    """Return the time format instance for a CUC configuration.
+
+    A mission typically uses one or a few CUC configurations, so formats are memoized
+    instead of being rebuilt (including the preamble) for every CUC time.
+    """
+    return _TimeFormat(basic_unit_length, frac_unit_length, epoch, preamble)
 
 
 class CucTime:
@@ -78,22 +132,57 @@ class CucTime:
             epoch -- epoch of time (default: {None})
             preamble -- ready-made preamble to use for this CUC time (default: {None})
         """
-        self._format = _TimeFormat(basic_unit_length, frac_unit_length, epoch, preamble)
+        self._format = _make_format(basic_unit_length, frac_unit_length, epoch, bytes(preamble) if preamble else None)
         self._has_preamble = has_preamble
+        self._size = (len(self._format) if has_preamble else 0) + self._format.time_field_size  # format is fixed for the lifetime of the instance
         self._seconds = seconds
         self._fraction = fraction if self._format.frac_unit_length else None
 
     def __len__(self):
-        return (len(self._format) if self._has_preamble else 0) + self._format.basic_unit_length + self._format.frac_unit_length
+        return self._size
 
     def __float__(self):
-        return self._seconds + (self._fraction / (2 ** (self._format.frac_unit_length * 8)))
+        return self._seconds + (self._fraction / self._format.frac_scale)
 
     def __str__(self):
         return f"{float(self):.3f} seconds since epoch ({self._format.epoch})"
 
     def __bytes__(self):
-        return (bytes(self._format) if self._has_preamble else b'') + (bitstring.pack(f'uintbe:{self._format.basic_unit_length * 8}', self._seconds).bytes) + (bitstring.pack(f'uintbe:{self._format.frac_unit_length * 8}', self._fraction).bytes if self._format.frac_unit_length else b'')
+        time_format = self._format
+        if self._has_preamble:
+            if time_format.cuc_struct:
+                return time_format.cuc_struct.pack(time_format.preamble, self._seconds, self._fraction)
+            return time_format.preamble + time_format.pack_time_field(self._seconds, self._fraction)
+        return time_format.pack_time_field(self._seconds, self._fraction)
+
+    def pack_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        """Write the binary format of the CUC time into a buffer.
+
+        Arguments:
+            buffer -- writable buffer large enough to hold the CUC time
+
+        Keyword Arguments:
+            offset -- position in buffer to write CUC time at (default: {0})
+
+        Raises:
+            ValueError: if offset is negative or buffer is too small
+
+        Returns:
+            number of bytes written
+        """
+        if offset < 0:
+            raise ValueError("Buffer offset must not be negative")  # a negative slice start would grow a bytearray
+        if len(buffer) - offset < self._size:
+            raise ValueError("Buffer too small to hold CUC time")
+        time_format = self._format
+        size = 0
+        if self._has_preamble:
+            if time_format.cuc_struct:
+                time_format.cuc_struct.pack_into(buffer, offset, time_format.preamble, self._seconds, self._fraction)
+                return time_format.cuc_struct.size
+            size = len(time_format.preamble)
+            buffer[offset:offset + size] = time_format.preamble
+        return size + time_format.pack_time_field_into(buffer, offset + size, self._seconds, self._fraction)
 
     @property
     def epoch(self) -> datetime:
@@ -105,7 +194,7 @@ class CucTime:
 
     @seconds.setter
     def seconds(self, val: int):
-        max_val = (2 ** (self._format.basic_unit_length * 8)) - 1
+        max_val = self._format.basic_max
         if isinstance(val, int) and 0 <= val <= max_val:
             self._seconds = val
         else:
@@ -119,7 +208,7 @@ class CucTime:
     def fraction(self, val: int):
         if self._format.frac_unit_length == 0:
             raise ValueError("CUC time configured without fraction part")
-        max_val = (2 ** (self._format.frac_unit_length * 8)) - 1
+        max_val = self._format.frac_max
         if isinstance(val, int) and 0 <= val <= max_val:
             self._fraction = val
         else:
@@ -152,11 +241,26 @@ class CucTime:
         if self._format.frac_unit_length:
             fraction, seconds = math.modf(seconds_since_epoch)
             self._seconds = int(seconds)
-            self._fraction = round(fraction * ((2 ** (self._format.frac_unit_length * 8)) - 1))
+            self._fraction = round(fraction * self._format.frac_max)
         else:
             self._seconds = round(seconds_since_epoch)
         return seconds_since_epoch
 
+    def set_now(self):
+        """Set CUC time to current system time (UTC).
+
+        Raises:
+            ValueError: if current time is before epoch or too far from epoch to be represented
+        """
+        seconds, remainder_ns = divmod(time_ns() - self._format.epoch_ns, _NS_PER_SECOND)
+        if seconds < 0:
+            raise ValueError("Cannot set CUC to before epoch")
+        if seconds > self._format.basic_max:
+            raise ValueError(f"Seconds since epoch exceed maximum of {self._format.basic_max}")
+        self._seconds = seconds
+        if self._format.frac_unit_length:
+            self._fraction = (remainder_ns * self._format.frac_scale) // _NS_PER_SECOND
+
     def from_bytes(self, buffer: SupportsBytes):
         """Set CUC time from a byte array.
 
@@ -166,13 +270,10 @@ class CucTime:
         Raises:
             ValueError: if buffer is malformed according to current CUC time instance
         """
-        preamble_size = len(self._format) if self._has_preamble else 0
-        if len(buffer) < preamble_size + self._format.basic_unit_length + self._format.frac_unit_length:
+        if len(buffer) < self._size:
             raise ValueError("Buffer too small to contain CUC")
 
-        fraction_offset = preamble_size + self._format.basic_unit_length
-        self._seconds = int.from_bytes(buffer[preamble_size:fraction_offset], byteorder='big')
-        self._fraction = int.from_bytes(buffer[fraction_offset:fraction_offset + self._format.frac_unit_length], byteorder='big')
+        self._seconds, self._fraction = self._format.unpack_time_field(buffer, self._size - self._format.time_field_size)
 
     @classmethod
     def deserialize(cls, buffer: SupportsBytes, has_preamble: bool = True, epoch: datetime | None = None, basic_unit_length: int | None = None, frac_unit_length: int | None = None) -> "CucTime":
@@ -203,14 +304,13 @@ class CucTime:
             frac_unit_length = time_format.frac_unit_length
             preamble = bytes(time_format)
         else:
+            time_format = _make_format(basic_unit_length, frac_unit_length, epoch)
             preamble = None
         preamble_size = len(time_format) if has_preamble else 0
         if len(buffer) < preamble_size + basic_unit_length + frac_unit_length:
             raise ValueError("Buffer too small to contain CUC")
 
-        fraction_offset = preamble_size + basic_unit_length
-        seconds = int.from_bytes(buffer[preamble_size:fraction_offset], byteorder='big')
-        fraction = int.from_bytes(buffer[fraction_offset:fraction_offset + frac_unit_length], byteorder='big')
+        seconds, fraction = time_format.unpack_time_field(buffer, preamble_size)
 
         return cls(
             seconds=seconds,
@@ -237,9 +337,22 @@ class CucTime:
         Returns:
             CUC time instance
         """
-        cuc_time = cls(seconds, fraction, basic_unit_length, frac_unit_length, has_preamble, epoch, preamble)
-        if seconds == 0 and fraction == 0:
-            # dt_now = datetime.now(timezone.utc)
-            dt_now = datetime.now()
-            cuc_time.from_datetime(dt_now)
+        return cls(seconds, fraction, basic_unit_length, frac_unit_length, has_preamble, epoch, preamble)
+
+    @classmethod
+    def now(cls, basic_unit_length=4, frac_unit_length=2, has_preamble=True, epoch=None, preamble=None) -> "CucTime":
+        """A factory method to create a CUC time instance set to current time.
+
+        Keyword Arguments:
+            basic_unit_length -- number of bytes to represent seconds (default: {4})
+            frac_unit_length -- number of bytes to represent fraction (default: {2})
+            has_preamble -- set to True if the CUC time has a preamble (default: {True})
+            epoch -- epoch of time (default: {None})
+            preamble -- ready-made preamble to use for this CUC time (default: {None})
+
+        Returns:
+            CUC time instance
+        """
+        cuc_time = cls(0, 0, basic_unit_length, frac_unit_length, has_preamble, epoch, preamble)
+        cuc_time.set_now()
         return cuc_time
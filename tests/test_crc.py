@@ -12,3 +12,8 @@ from puslib import crc_ccitt
 ])
 def test_calculate(data, crc):
     assert crc_ccitt.calculate(data) == crc
+
+
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_calculate_buffer_types(buffer_type):
+    assert crc_ccitt.calculate(buffer_type(b"123456789")) == 0x29b1
@@ -1,4 +1,6 @@
-from collections import namedtuple
+from array import array
+from dataclasses import dataclass, fields
+from functools import cached_property
 
 import pytest
 
@@ -6,6 +8,7 @@ from puslib.packet import CcsdsSpacePacket
 from puslib.packet import PusTcPacket
 from puslib.packet import PusTmPacket
 from puslib.packet import PacketType
+from puslib.packet import SequenceFlag
 from puslib.packet import AckFlag
 from puslib.time import CucTime
 
@@ -16,7 +19,36 @@ PUS_SUBSERVICE = 1
 TC_SOURCE = 0x02
 DATA = bytes.fromhex('DEADBEEF')
 
-CcsdsPacketArgs = namedtuple('CcsdsPacketArgs', ['packet_version_number', 'packet_type', 'secondary_header_flag', 'apid', 'seq_flags', 'seq_count_or_name', 'data', 'has_pec'])
+
+class _PacketArgs:
+    @cached_property
+    def kwargs(self):
+        # Only the fields set, leaving the others to the factory defaults
+        return {field.name: getattr(self, field.name) for field in fields(self) if getattr(self, field.name) is not None}
+
+
+@dataclass(frozen=True)
+class CcsdsPacketArgs(_PacketArgs):
+    packet_version_number: int | None
+    packet_type: PacketType
+    secondary_header_flag: bool | None
+    apid: int
+    seq_flags: int | None
+    seq_count_or_name: int
+    data: bytes
+    has_pec: bool
+
+
+@dataclass(frozen=True)
+class ExpectedCcsdsPacket:
+    packet_type: PacketType
+    apid: int
+    seq_count_or_name: int
+    data: bytes
+    has_pec: bool
+    packet_version_number: int = 0
+    secondary_header_flag: bool = True
+    seq_flags: SequenceFlag = SequenceFlag.UNSEGMENTED
 
 
 @pytest.mark.parametrize("args", [
@@ -26,22 +58,45 @@ CcsdsPacketArgs = namedtuple('CcsdsPacketArgs', ['packet_version_number', 'packe
     CcsdsPacketArgs(0, PacketType.TM, False, APID, 0b11, SEQ_COUNT_OR_NAME, DATA, False),
 ])
 def test_create_ccsds_packet(args):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-
-    packet = CcsdsSpacePacket.create(**args_to_pass)
-    assert packet.header.packet_version_number == args.packet_version_number if args.packet_version_number else 1
-    assert packet.header.packet_type == args.packet_type
-    assert packet.packet_type == args.packet_type
-    assert packet.header.secondary_header_flag == args.secondary_header_flag if args.secondary_header_flag else True
-    assert packet.header.apid == args.apid
-    assert packet.apid == args.apid
-    assert packet.header.seq_flags == args.seq_flags if args.seq_flags else 0b11
-    assert packet.header.seq_count_or_name == args.seq_count_or_name
-    assert packet.payload == args.data
-    assert len(packet) == 6 + (len(args.data) if args.data else 0) + (2 if args.has_pec else 0)
-
-
-TcPacketArgs = namedtuple('TcPacketArgs', ['apid', 'name', 'pus_version', 'ack_flags', 'service_type', 'service_subtype', 'source', 'data', 'has_pec'])
+    expected = ExpectedCcsdsPacket(**args.kwargs)
+    packet = CcsdsSpacePacket.create(**args.kwargs)
+    assert packet.header.packet_version_number == expected.packet_version_number
+    assert packet.header.packet_type == expected.packet_type
+    assert packet.packet_type == expected.packet_type
+    assert packet.header.secondary_header_flag == expected.secondary_header_flag
+    assert packet.header.apid == expected.apid
+    assert packet.apid == expected.apid
+    assert packet.header.seq_flags == expected.seq_flags
+    assert packet.header.seq_count_or_name == expected.seq_count_or_name
+    assert packet.payload == expected.data
+    assert len(packet) == 6 + len(expected.data) + (2 if expected.has_pec else 0)
+
+
+@dataclass(frozen=True)
+class TcPacketArgs(_PacketArgs):
+    apid: int
+    name: int
+    pus_version: int | None
+    ack_flags: AckFlag
+    service_type: int
+    service_subtype: int
+    source: int | None
+    data: bytes | None
+    has_pec: bool
+
+
+TC_PUS1 = bytes.fromhex('1810c0500002110801')
+TC_PUS1_PEC = bytes.fromhex('1810c05000041108017e6c')
+TC_PUS1_SOURCE = bytes.fromhex('1810c050000311080102')
+TC_PUS1_SOURCE_PEC = bytes.fromhex('1810c050000511080102794a')
+TC_PUS1_SOURCE_DATA = bytes.fromhex('1810c050000711080102deadbeef')
+TC_PUS1_SOURCE_DATA_PEC = bytes.fromhex('1810c050000911080102deadbeef1a29')
+TC_PUS2 = bytes.fromhex('1810c0500002210801')
+TC_PUS2_PEC = bytes.fromhex('1810c0500004210801bbc9')
+TC_PUS2_SOURCE = bytes.fromhex('1810c050000321080102')
+TC_PUS2_SOURCE_PEC = bytes.fromhex('1810c05000052108010255a3')
+TC_PUS2_SOURCE_DATA = bytes.fromhex('1810c050000721080102deadbeef')
+TC_PUS2_SOURCE_DATA_PEC = bytes.fromhex('1810c050000921080102deadbeef5cf5')
 
 
 @pytest.mark.parametrize("args", [
@@ -50,9 +105,7 @@ TcPacketArgs = namedtuple('TcPacketArgs', ['apid', 'name', 'pus_version', 'ack_f
     TcPacketArgs(APID, SEQ_COUNT_OR_NAME, 2, AckFlag.ACCEPTANCE | AckFlag.COMPLETION, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, True),
 ])
 def test_tc_packet_create(args):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-
-    packet = PusTcPacket.create(**args_to_pass)
+    packet = PusTcPacket.create(**args.kwargs)
     assert packet.name == args.name
     assert packet.secondary_header.pus_version == args.pus_version
     assert packet.secondary_header.ack_flags == args.ack_flags
@@ -70,8 +123,7 @@ def test_tc_packet_create(args):
     (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, True), 16),
 ])
 def test_tc_packet_length(args, length):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-    packet = PusTcPacket.create(**args_to_pass)
+    packet = PusTcPacket.create(**args.kwargs)
     assert len(packet) == length
 
 
@@ -80,8 +132,7 @@ def test_tc_packet_length(args, length):
     (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE | AckFlag.COMPLETION, PUS_SERVICE, PUS_SUBSERVICE, None, b'', True), (AckFlag.ACCEPTANCE, AckFlag.COMPLETION), (AckFlag.START_OF_EXECUTION, AckFlag.PROGRESS)),
 ])
 def test_tc_ack(args, acks_activated, acks_deactivated):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-    packet = PusTcPacket.create(**args_to_pass)
+    packet = PusTcPacket.create(**args.kwargs)
     for ack in acks_activated:
         assert packet.ack(ack)
     for ack in acks_deactivated:
@@ -89,30 +140,38 @@ def test_tc_ack(args, acks_activated, acks_deactivated):
 
 
 @pytest.mark.parametrize("args, binary", [
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', False), bytes.fromhex('1810c0500002110801')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', True), bytes.fromhex('1810c05000041108017e6c')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', False), bytes.fromhex('1810c050000311080102')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', True), bytes.fromhex('1810c050000511080102794a')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, False), bytes.fromhex('1810c050000711080102deadbeef')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, True), bytes.fromhex('1810c050000911080102deadbeef1a29')),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', False), TC_PUS1),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', True), TC_PUS1_PEC),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', False), TC_PUS1_SOURCE),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', True), TC_PUS1_SOURCE_PEC),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, False), TC_PUS1_SOURCE_DATA),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, True), TC_PUS1_SOURCE_DATA_PEC),
 ])
 def test_tc_packet_serialize(args, binary):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-    packet = PusTcPacket.create(**args_to_pass)
+    packet = PusTcPacket.create(**args.kwargs)
     buffer = packet.serialize()
     assert len(packet) == len(buffer)
     assert len(buffer) == len(binary)
     assert buffer == binary
     assert bytes(packet) == binary
 
+    buffer = bytearray(len(binary) + 1)
+    assert packet.serialize(buffer, 1) == len(binary)
+    assert buffer[1:] == binary
+    with pytest.raises(ValueError):
+        packet.serialize(buffer, 2)
+    with pytest.raises(ValueError):
+        packet.serialize(buffer, -1)
+    assert len(buffer) == len(binary) + 1
+
 
 @pytest.mark.parametrize("args, binary", [
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', False), bytes.fromhex('1810c0500002210801')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', True), bytes.fromhex('1810c0500004210801bbc9')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', False), bytes.fromhex('1810c050000321080102')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', True), bytes.fromhex('1810c05000052108010255a3')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, False), bytes.fromhex('1810c050000721080102deadbeef')),
-    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, True), bytes.fromhex('1810c050000921080102deadbeef5cf5')),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', False), TC_PUS2),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, None, b'', True), TC_PUS2_PEC),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', False), TC_PUS2_SOURCE),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, b'', True), TC_PUS2_SOURCE_PEC),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, False), TC_PUS2_SOURCE_DATA),
+    (TcPacketArgs(APID, SEQ_COUNT_OR_NAME, None, AckFlag.ACCEPTANCE, PUS_SERVICE, PUS_SUBSERVICE, TC_SOURCE, DATA, True), TC_PUS2_SOURCE_DATA_PEC),
 ])
 def test_tc_packet_deserialize(args, binary):
     packet = PusTcPacket.deserialize(binary, has_source_field=True if args.source else False, has_pec=True if args.has_pec else False)
@@ -136,9 +195,31 @@ PUS_SUBSERVICE = 4
 MSG_TYPE_COUNTER = 0x13
 TM_DESTINATION = 0x02
 TIME = CucTime(100, 10000, 4, 2)
+TIME_BYTES = bytes(TIME)
 DATA = bytes.fromhex('DEADBEEF')
 
-TmPacketArgs = namedtuple('TmPacketArgs', ['apid', 'seq_count', 'pus_version', 'spacecraft_time_ref_status', 'service_type', 'service_subtype', 'msg_type_counter', 'destination', 'time', 'data', 'has_pec'])
+@dataclass(frozen=True)
+class TmPacketArgs(_PacketArgs):
+    apid: int
+    seq_count: int
+    pus_version: int | None
+    spacecraft_time_ref_status: int | None
+    service_type: int
+    service_subtype: int
+    msg_type_counter: int | None
+    destination: int | None
+    time: CucTime
+    data: bytes | None
+    has_pec: bool
+
+
+# Primary and secondary headers up to the time field
+TM_HEADERS = bytes.fromhex('0810c0500009108204')
+TM_HEADERS_COUNTER = bytes.fromhex('0810c050000a10820413')
+TM_HEADERS_COUNTER_DESTINATION = bytes.fromhex('0810c050000b1182041302')
+TM_HEADERS_COUNTER_DESTINATION_DATA = bytes.fromhex('0810c050000f1182041302')
+TM_HEADERS_COUNTER_DESTINATION_DATA_PEC = bytes.fromhex('0810c05000111182041302')
+TM_PEC = bytes.fromhex('9ee2')
 
 
 @pytest.mark.parametrize("args", [
@@ -146,9 +227,7 @@ TmPacketArgs = namedtuple('TmPacketArgs', ['apid', 'seq_count', 'pus_version', '
     TmPacketArgs(APID, SEQ_COUNT_OR_NAME, 2, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, True),
 ])
 def test_tm_packet_create(args):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-
-    packet = PusTmPacket.create(**args_to_pass)
+    packet = PusTmPacket.create(**args.kwargs)
     assert packet.seq_count == args.seq_count
     assert packet.secondary_header.pus_version == args.pus_version
     assert packet.secondary_header.spacecraft_time_ref_status == (args.spacecraft_time_ref_status if args.spacecraft_time_ref_status else 0)
@@ -168,34 +247,41 @@ def test_tm_packet_create(args):
     (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, True), 24),
 ])
 def test_tm_packet_length(args, length):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-    packet = PusTmPacket.create(**args_to_pass)
+    packet = PusTmPacket.create(**args.kwargs)
     assert len(packet) == length
 
 
 @pytest.mark.parametrize("args, binary", [
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, None, None, TIME, None, False), bytes.fromhex('0810c0500009108204') + bytes(TIME)),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, None, TIME, None, False), bytes.fromhex('0810c050000a10820413') + bytes(TIME)),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, None, False), bytes.fromhex('0810c050000b1182041302') + bytes(TIME)),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, False), bytes.fromhex('0810c050000f1182041302') + bytes(TIME) + DATA),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, True), bytes.fromhex('0810c05000111182041302') + bytes(TIME) + DATA + bytes.fromhex('9ee2')),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, None, None, TIME, None, False), TM_HEADERS + TIME_BYTES),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, None, TIME, None, False), TM_HEADERS_COUNTER + TIME_BYTES),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, None, False), TM_HEADERS_COUNTER_DESTINATION + TIME_BYTES),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, False), TM_HEADERS_COUNTER_DESTINATION_DATA + TIME_BYTES + DATA),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, True), TM_HEADERS_COUNTER_DESTINATION_DATA_PEC + TIME_BYTES + DATA + TM_PEC),
 ])
 def test_tm_packet_serialize(args, binary):
-    args_to_pass = {k: v for k, v in args._asdict().items() if v is not None}
-    packet = PusTmPacket.create(**args_to_pass)
+    packet = PusTmPacket.create(**args.kwargs)
     buffer = packet.serialize()
     assert len(packet) == len(buffer)
     assert len(buffer) == len(binary)
     assert buffer == binary
     assert bytes(packet) == binary
 
+    buffer = bytearray(len(binary) + 1)
+    assert packet.serialize(buffer, 1) == len(binary)
+    assert buffer[1:] == binary
+    with pytest.raises(ValueError):
+        packet.serialize(buffer, 2)
+    with pytest.raises(ValueError):
+        packet.serialize(buffer, -1)
+    assert len(buffer) == len(binary) + 1
+
 
 @pytest.mark.parametrize("args, binary", [
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, None, None, TIME, b'', False), bytes.fromhex('0810c0500009108204') + bytes(TIME)),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, None, TIME, b'', False), bytes.fromhex('0810c050000a10820413') + bytes(TIME)),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, b'', False), bytes.fromhex('0810c050000b1182041302') + bytes(TIME)),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, False), bytes.fromhex('0810c050000f1182041302') + bytes(TIME) + DATA),
-    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, True), bytes.fromhex('0810c05000111182041302') + bytes(TIME) + DATA + bytes.fromhex('9ee2')),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, None, None, TIME, b'', False), TM_HEADERS + TIME_BYTES),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, None, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, None, TIME, b'', False), TM_HEADERS_COUNTER + TIME_BYTES),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, b'', False), TM_HEADERS_COUNTER_DESTINATION + TIME_BYTES),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, False), TM_HEADERS_COUNTER_DESTINATION_DATA + TIME_BYTES + DATA),
+    (TmPacketArgs(APID, SEQ_COUNT_OR_NAME, None, 1, PUS_SERVICE, PUS_SUBSERVICE, MSG_TYPE_COUNTER, TM_DESTINATION, TIME, DATA, True), TM_HEADERS_COUNTER_DESTINATION_DATA_PEC + TIME_BYTES + DATA + TM_PEC),
 ])
 def test_tm_packet_deserialize(args, binary):
     packet = PusTmPacket.deserialize(binary, has_type_counter_field=True if args.msg_type_counter else False, has_destination_field=True if args.destination else False, cuc_time=TIME, has_pec=True if args.has_pec else False)
@@ -215,3 +301,46 @@ def test_tm_packet_deserialize(args, binary):
     buffer = packet.serialize()
     assert len(buffer) == len(binary)
     assert buffer == binary
+
+
+def test_packet_memoryview_data():
+    buffer = bytes.fromhex('00') + DATA
+    packet = PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=memoryview(buffer)[1:])
+    assert bytes(packet) == bytes(PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=DATA))
+
+
+def test_packet_memoryview_non_byte_format_data():
+    items = array('H', [1, 2])
+    packet = PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=memoryview(items))
+    assert len(packet) == len(bytes(packet))
+    assert bytes(packet) == bytes(PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=items.tobytes()))
+    with pytest.raises(ValueError):
+        PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=memoryview(array('H', [1, 2, 3, 4]))[::2])
+
+
+
+def test_packet_memoryview_byte_format_shaped_data():
+    buffer = bytearray(range(6))
+    packet = PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=memoryview(buffer).cast('B', (2, 3)))
+    assert len(packet) == len(bytes(packet))
+    assert bytes(packet) == bytes(PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=bytes(buffer)))
+    with pytest.raises(ValueError):
+        PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=memoryview(buffer)[::2])
+
+def test_packet_deserialize_memoryview():
+    binary = bytes.fromhex('ff') + bytes(PusTmPacket.create(apid=APID, seq_count=SEQ_COUNT_OR_NAME, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=DATA))
+    packet = PusTmPacket.deserialize(memoryview(binary)[1:], has_type_counter_field=False, has_destination_field=False)
+    assert bytes(packet.time) == TIME_BYTES
+    assert packet.source_data == DATA
+    assert bytes(packet) == binary[1:]
+
+
+def test_serialize_many():
+    packets = [PusTmPacket.create(apid=APID, seq_count=seq_count, service_type=PUS_SERVICE, service_subtype=PUS_SUBSERVICE, time=TIME, data=DATA[:seq_count]) for seq_count in range(3)]
+    binary = b''.join(bytes(packet) for packet in packets)
+    buffer = bytearray(len(binary) + 1)
+    offsets = PusTmPacket.serialize_many(packets, buffer, 1)
+    assert offsets == [1, 1 + len(packets[0]), 1 + len(packets[0]) + len(packets[1])]
+    assert buffer[1:] == binary
+    with pytest.raises(ValueError):
+        PusTmPacket.serialize_many(packets, buffer, 2)
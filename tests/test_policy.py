@@ -28,6 +28,13 @@ def test_factory_functions():
 
 
 
+def test_tc_factory_does_not_count_messages():
+    cuc_time = get_policy().CucTime()
+    tm_packet = get_policy().PusTmPacket(service_type=17, service_subtype=2, time=cuc_time)
+    get_policy().PusTcPacket(service_type=17, service_subtype=2)
+    assert get_policy().PusTmPacket(service_type=17, service_subtype=2, time=cuc_time).counter == (tm_packet.counter + 1) & 0xff
+
+
 def test_set_policy():
     class Policy1(PusPolicy):
         def __init__(self):
@@ -64,3 +71,34 @@ def test_set_policy():
 
     tc_packet = get_policy().PusTcPacket()
     assert tc_packet.secondary_header.pus_version == 2
+
+
+def test_policy_settings_not_shared():
+    policy1 = PusPolicy()
+    policy2 = PusPolicy()
+    policy1.request_verification.failure_code_type = UInt16Parameter
+    policy1.common.tm.time.basic_unit_length = 2
+    assert policy2.request_verification.failure_code_type is UInt8Parameter
+    assert policy2.common.tm.time.basic_unit_length == 4
+
+
+def test_policy_changes_apply_to_next_call():
+    policy = PusPolicy()
+    assert len(policy.CucTime(1, 2)) == 7
+    policy.common.tm.time.has_preamble = True
+    assert len(policy.CucTime(1, 2)) == 8
+    policy.common.pus_version = 2
+    assert policy.PusTcPacket().secondary_header.pus_version == 2
+    assert policy.PusTmPacket(time=policy.CucTime(1, 2)).secondary_header.pus_version == 2
+
+
+def test_set_duck_typed_policy():
+    class Policy:
+        def __init__(self):
+            self.common = PusPolicy.Common()
+
+    previous_policy = get_policy()
+    policy = Policy()
+    set_policy(policy)
+    assert get_policy() is policy
+    set_policy(previous_policy)
@@ -0,0 +1,20 @@
+from puslib import get_policy
+from puslib.streams.file import FileInput
+
+
+def test_file_input(tmp_path):
+    packets = [get_policy().PusTmPacket(apid=0x10, seq_count=seq_count, service_type=3, service_subtype=25, time=get_policy().CucTime(seq_count, 2), data=bytes([seq_count] * seq_count)) for seq_count in range(1, 3)]
+    archive_file = tmp_path / "archive.bin"
+    archive_file.write_bytes(b''.join(bytes(packet) for packet in packets))
+
+    archive = FileInput(archive_file)
+    for (_, packet), expected in zip(archive, packets, strict=True):
+        assert bytes(packet) == bytes(expected)
+        assert bytes(packet.time) == bytes(expected.time)
+
+    offset = 0
+    for expected in packets:
+        packet = archive.read(offset)
+        assert bytes(packet) == bytes(expected)
+        assert packet.time.seconds == expected.time.seconds
+        offset += len(expected)
@@ -1,10 +1,11 @@
 import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from puslib.time import CucTime, TAI_EPOCH
 from puslib.exceptions import InvalidTimeFormat
+from puslib.pus_policy import PusPolicy
 
 
 @pytest.mark.parametrize("basic_unit_length, frac_unit_length, seconds, fraction", [
@@ -111,6 +112,19 @@ def test_serialize(packed_cuc, has_preamble, epoch, num_second_octets, num_fract
     assert bytes(ct) == packed_cuc
 
 
+@pytest.mark.parametrize("packed_cuc, has_preamble, epoch, num_second_octets, num_fraction_octets, seconds, fraction", COMMON_CUCTIME_TEST_VECTORS)
+def test_pack_into(packed_cuc, has_preamble, epoch, num_second_octets, num_fraction_octets, seconds, fraction):
+    ct = CucTime(seconds, fraction, num_second_octets, num_fraction_octets, has_preamble, epoch)
+    buffer = bytearray(len(packed_cuc) + 2)
+    assert ct.pack_into(buffer, 1) == len(packed_cuc)
+    assert buffer == b'\x00' + packed_cuc + b'\x00'
+    with pytest.raises(ValueError):
+        ct.pack_into(buffer, 3)
+    with pytest.raises(ValueError):
+        ct.pack_into(buffer, -1)
+    assert len(buffer) == len(packed_cuc) + 2
+
+
 @pytest.mark.parametrize("packed_cuc, has_preamble, epoch, num_second_octets, num_fraction_octets, seconds, fraction", COMMON_CUCTIME_TEST_VECTORS)
 def test_deserialize(packed_cuc, has_preamble, epoch, num_second_octets, num_fraction_octets, seconds, fraction):
     ct = CucTime.deserialize(packed_cuc, has_preamble, epoch, num_second_octets, num_fraction_octets)
@@ -120,3 +134,76 @@ def test_deserialize(packed_cuc, has_preamble, epoch, num_second_octets, num_fra
     assert ct.fraction == fraction
     assert ct._format.basic_unit_length == num_second_octets  # pylint: disable=protected-access
     assert ct._format.frac_unit_length == num_fraction_octets  # pylint: disable=protected-access
+
+
+
+def test_policy_default_format():
+    policy = PusPolicy()
+    ct = policy.CucTime(0x01020304, 0x050607)
+    packed_cuc = bytes.fromhex('01020304050607')
+    assert bytes(ct) == packed_cuc
+    buffer = bytearray(len(packed_cuc) + 2)
+    assert ct.pack_into(buffer, 1) == len(packed_cuc)
+    assert buffer == b'\x00' + packed_cuc + b'\x00'
+    buffer = bytearray(3)
+    with pytest.raises(ValueError):
+        ct.pack_into(buffer, 0)
+    with pytest.raises(ValueError):
+        ct.pack_into(buffer, -1)
+    assert len(buffer) == 3
+    ct = policy.CucTime()
+    ct.from_bytes(packed_cuc)
+    assert ct.time_field == (0x01020304, 0x050607)
+    time_settings = policy.common.tm.time
+    ct = CucTime.deserialize(packed_cuc, time_settings.has_preamble, time_settings.epoch, time_settings.basic_unit_length, time_settings.frac_unit_length)
+    assert ct.time_field == (0x01020304, 0x050607)
+
+
+
+@pytest.mark.parametrize("basic_unit_length, frac_unit_length, seconds, fraction", [
+    (4, 3, 1, 2 ** 24),
+    (4, 3, 1, -1),
+    (4, 3, 2 ** 32, 0),
+    (3, 0, 2 ** 24, None),
+])
+def test_serialize_out_of_range_odd_length(basic_unit_length, frac_unit_length, seconds, fraction):
+    ct = CucTime(seconds, fraction, basic_unit_length, frac_unit_length, has_preamble=False)
+    with pytest.raises(ValueError):
+        bytes(ct)
+    with pytest.raises(ValueError):
+        ct.pack_into(bytearray(len(ct)))
+
+
+@pytest.mark.parametrize("basic_unit_length, frac_unit_length, epoch", [
+    (4, 2, None),
+    (4, 0, None),
+    (4, 3, datetime(2000, 1, 1)),
+])
+def test_set_now(basic_unit_length, frac_unit_length, epoch):
+    ct = CucTime(basic_unit_length=basic_unit_length, frac_unit_length=frac_unit_length, epoch=epoch)
+    expected = (datetime.now(timezone.utc).replace(tzinfo=None) - ct.epoch).total_seconds()
+    ct.set_now()
+    assert abs(ct.seconds - expected) < 2
+    if frac_unit_length:
+        assert 0 <= ct.fraction < 2 ** (frac_unit_length * 8)
+    else:
+        assert ct.fraction is None
+
+
+@pytest.mark.parametrize("basic_unit_length, epoch", [
+    (4, datetime(2100, 1, 1)),
+    (1, None),
+])
+def test_set_now_out_of_range(basic_unit_length, epoch):
+    ct = CucTime(basic_unit_length=basic_unit_length, epoch=epoch)
+    with pytest.raises(ValueError):
+        ct.set_now()
+    assert ct.seconds == 0
+
+
+def test_create():
+    ct = CucTime.create()
+    assert ct.time_field == (0, 0)
+
+    ct = CucTime.now()
+    assert ct.seconds > 0